@@ -0,0 +1,582 @@
+import csv
+import itertools
+import json
+import math
+from collections import namedtuple
+from concurrent.futures import ProcessPoolExecutor
+import numpy as np
+
+# ============================================================
+# UAV STRATEGIC DECONFLICTION CORE
+# ============================================================
+# Dimension-generic deconfliction shared by the 2D and 3D
+# modules. Each waypoint holds its spatial coordinates
+# followed by time, e.g. (x, y, time) or (x, y, z, time).
+# ============================================================
+
+# Drone pairs handed to each worker process
+PAIR_BATCH_SIZE = 64
+
+# Fleets up to this size pair every drone without the grid
+GRID_MIN_DRONES = 16
+
+# Grid pieces a segment may split into before its drone is
+# paired with the whole fleet instead of hashed
+MAX_SEGMENT_PIECES = 64
+
+
+# ------------------------------------------------------------
+# Conflict record for one encounter between two drones
+# ------------------------------------------------------------
+Conflict = namedtuple(
+    "Conflict", ["time", "exit_time", "location", "distance", "between"]
+)
+
+
+# ------------------------------------------------------------
+# Sort waypoints in ascending order of time
+# ------------------------------------------------------------
+def sort_path_by_time(path):
+    """
+    Ensures that the waypoint sequence is temporally ordered.
+    """
+    return sorted(path, key=lambda p: p[-1])
+
+
+# ------------------------------------------------------------
+# Pack a trajectory into position and time arrays
+# ------------------------------------------------------------
+def pack_path(path, dim, name=None):
+    """
+    Converts a sequence of waypoints with dim coordinates
+    followed by time into a time-ordered trajectory
+    {"pos": (N, dim) array, "t": (N,) array}. Trajectories
+    that are already packed are returned unchanged.
+    Raises ValueError naming the drone when the waypoints do
+    not hold dim + 1 values each.
+    """
+    if isinstance(path, dict):
+        return path
+
+    waypoints = np.asarray(sort_path_by_time(path), dtype=float)
+
+    if waypoints.size == 0:
+        waypoints = waypoints.reshape(0, dim + 1)
+    elif waypoints.ndim != 2 or waypoints.shape[1] != dim + 1:
+        drone = "trajectory" if name is None else f"drone '{name}'"
+        raise ValueError(
+            f"Waypoints of {drone} must hold {dim + 1} values each"
+        )
+
+    return {
+        "pos": np.ascontiguousarray(waypoints[:, :dim]),
+        "t": np.ascontiguousarray(waypoints[:, dim]),
+    }
+
+
+# ------------------------------------------------------------
+# Linear interpolation along a trajectory segment
+# ------------------------------------------------------------
+def interpolate(path, i, t):
+    """
+    Computes the interpolated position at time t between
+    waypoints i and i + 1 of a packed trajectory.
+    """
+    pos, times = path["pos"], path["t"]
+    t1, t2 = times[i], times[i + 1]
+
+    # Prevent division by zero for identical timestamps
+    if t2 == t1:
+        return tuple(pos[i].tolist())
+
+    ratio = (t - t1) / (t2 - t1)
+
+    return tuple((pos[i] + ratio * (pos[i + 1] - pos[i])).tolist())
+
+
+# ------------------------------------------------------------
+# Locate the trajectory segment active at given times
+# ------------------------------------------------------------
+def segment_indices(times, ts):
+    """
+    Returns, for every time in ts, the index of the segment
+    (times[i], times[i + 1]] that contains it. Times before
+    the second waypoint map to the first segment.
+    """
+    idx = np.searchsorted(times, ts) - 1
+    return np.clip(idx, 0, len(times) - 2)
+
+
+# ------------------------------------------------------------
+# Relative motion of two drones along given segments
+# ------------------------------------------------------------
+def get_relative_motion(path1, seg1, path2, seg2, ts):
+    """
+    Returns the position of drone 1 relative to drone 2
+    at times ts, while they fly segments seg1 and seg2 of
+    their packed trajectories, together with their constant
+    relative velocity. Neither drone's own position is built;
+    segments must span a non-zero duration.
+    """
+    pos1, times1 = path1["pos"], path1["t"]
+    pos2, times2 = path2["pos"], path2["t"]
+
+    span1 = (times1[seg1 + 1] - times1[seg1])[:, None]
+    span2 = (times2[seg2 + 1] - times2[seg2])[:, None]
+    vel1 = (pos1[seg1 + 1] - pos1[seg1]) / span1
+    vel2 = (pos2[seg2 + 1] - pos2[seg2]) / span2
+
+    rel_pos = (pos1[seg1] - pos2[seg2] +
+               (ts - times1[seg1])[:, None] * vel1 -
+               (ts - times2[seg2])[:, None] * vel2)
+    return rel_pos, vel1 - vel2
+
+
+# ------------------------------------------------------------
+# Closed-form minimum separation of linearly moving drones
+# ------------------------------------------------------------
+def solve_separation(rel_pos, rel_vel, duration, safety_distance):
+    """
+    Finds where two drones moving at constant velocity come
+    within the safety distance. Rows of rel_pos and rel_vel
+    hold the relative position at the start of an interval
+    and the relative velocity over it; duration holds the
+    interval length.
+
+    The squared separation a*tau^2 + b*tau + c is quadratic
+    in the elapsed time tau, so its minimum and the times it
+    crosses the safety distance follow analytically.
+    Returns (conflict, entry, leave, closest, min_dist_sq)
+    arrays, where entry and leave are the elapsed times at
+    which the conflict begins and ends, and closest is the
+    elapsed time of the minimum distance.
+    """
+    a = np.einsum("ij,ij->i", rel_vel, rel_vel)
+    b = 2 * np.einsum("ij,ij->i", rel_pos, rel_vel)
+    c = np.einsum("ij,ij->i", rel_pos, rel_pos)
+    safety_sq = safety_distance ** 2
+
+    # Closest approach at the vertex, clipped to the interval
+    closest = np.divide(-b, 2 * a, out=np.zeros_like(a), where=a > 0)
+    closest = np.clip(closest, 0, duration)
+    # Rounding can leave a touching separation slightly negative
+    min_dist_sq = np.maximum((a * closest + b) * closest + c, 0)
+    end_dist_sq = (a * duration + b) * duration + c
+
+    conflict = min_dist_sq <= safety_sq
+
+    # The conflict spans the whole interval unless the buffer
+    # is crossed, in which case entry and leave are the roots
+    # of a*tau^2 + b*tau + c = safety^2. Roots are only solved
+    # for conflicting intervals that cross, which guarantees
+    # a > 0 there.
+    entry = np.zeros_like(a)
+    leave = np.array(duration, dtype=float)
+
+    crossing = conflict & ((c > safety_sq) | (end_dist_sq > safety_sq))
+    a, b, c, span = a[crossing], b[crossing], c[crossing], leave[crossing]
+    half_width = np.sqrt(np.maximum(b * b - 4 * a * (c - safety_sq), 0))
+    first = np.clip((-b - half_width) / (2 * a), 0, span)
+    second = np.clip((-b + half_width) / (2 * a), 0, span)
+
+    entry[crossing] = np.where(c > safety_sq, first, 0)
+    leave[crossing] = np.where(end_dist_sq[crossing] > safety_sq, second, span)
+
+    return conflict, entry, leave, closest, min_dist_sq
+
+
+# ------------------------------------------------------------
+# Axis-aligned bounding box of a trajectory
+# ------------------------------------------------------------
+def path_bounding_box(path, margin):
+    """
+    Returns the (mins, maxs) corners of the axis-aligned box
+    enclosing every waypoint of a packed trajectory, inflated
+    by margin.
+    """
+    pos = path["pos"]
+    return pos.min(axis=0) - margin, pos.max(axis=0) + margin
+
+
+# ------------------------------------------------------------
+# Axis-aligned bounding boxes of trajectory segments
+# ------------------------------------------------------------
+def segment_bounding_boxes(path, margin):
+    """
+    Returns (mins, maxs) arrays holding one box per segment
+    between consecutive waypoints of a packed trajectory,
+    inflated by margin.
+    """
+    pos = path["pos"]
+    mins = np.minimum(pos[:-1], pos[1:]) - margin
+    maxs = np.maximum(pos[:-1], pos[1:]) + margin
+    return mins, maxs
+
+
+# ------------------------------------------------------------
+# Test two bounding boxes for intersection
+# ------------------------------------------------------------
+def boxes_overlap(box1, box2):
+    """
+    Returns True when the two (mins, maxs) boxes intersect.
+    """
+    return bool(np.all(box1[0] <= box2[1]) and np.all(box2[0] <= box1[1]))
+
+
+# ------------------------------------------------------------
+# Find drone pairs that meet in a space-time grid
+# ------------------------------------------------------------
+def find_candidate_pairs(paths, safety_distance):
+    """
+    Returns the index pairs (i, j), i < j, of packed
+    trajectories that may come within the safety distance.
+
+    Segments are split into pieces no larger than one cell
+    of a uniform space-time grid. Each piece is bounded by
+    a box grown by half the safety distance and hashed into
+    every cell it covers. Drones that never share a cell
+    cannot conflict, so only drones meeting in some cell are
+    paired instead of every pair in the fleet.
+
+    Small fleets skip the grid and pair every drone. A drone
+    with a segment needing more than MAX_SEGMENT_PIECES pieces,
+    such as one long leg or hover among short steps, is paired
+    with every other drone so the grid work stays bounded.
+    """
+    if len(paths) <= GRID_MIN_DRONES:
+        return list(itertools.combinations(range(len(paths)), 2))
+
+    tracks = [np.column_stack([p["pos"], p["t"]]) for p in paths]
+    steps = np.abs(np.vstack([np.diff(w, axis=0) for w in tracks]))
+
+    # Segments between waypoints sharing a timestamp would size
+    # the time axis to zero, so only timed segments set the size
+    timed = steps[:, -1] > 0
+    if timed.any():
+        steps = steps[timed]
+
+    # Cells sized to a typical segment, and at least as wide as
+    # the safety distance so a piece box spans few cells. Axes
+    # without movement fall back to the extent of the data.
+    points = np.vstack(tracks)
+    cell = np.median(steps, axis=0)
+    cell[:-1] = np.maximum(cell[:-1], safety_distance)
+    cell = np.where(cell > 0, cell, points.max(axis=0) - points.min(axis=0))
+    cell[cell <= 0] = 1.0
+
+    grid = {}
+    wide = []
+    for i, track in enumerate(tracks):
+        # Split every segment into pieces that fit a cell
+        pieces = np.ceil(np.abs(np.diff(track, axis=0)) / cell).max(axis=1)
+        if pieces.max() > MAX_SEGMENT_PIECES:
+            wide.append(i)
+            continue
+        pieces = np.maximum(pieces, 1).astype(int)
+
+        seg = np.repeat(np.arange(len(pieces)), pieces)
+        k = np.arange(len(seg)) - np.repeat(np.cumsum(pieces) - pieces, pieces)
+
+        # Interpolate both piece ends from the segment endpoints so
+        # the last piece ends exactly on the next waypoint
+        f0 = (k / pieces[seg])[:, None]
+        f1 = ((k + 1) / pieces[seg])[:, None]
+        start = (1 - f0) * track[seg] + f0 * track[seg + 1]
+        end = (1 - f1) * track[seg] + f1 * track[seg + 1]
+
+        lo = np.minimum(start, end)
+        hi = np.maximum(start, end)
+        lo[:, :-1] -= safety_distance / 2
+        hi[:, :-1] += safety_distance / 2
+
+        lo_cells = np.floor(lo / cell).astype(int).tolist()
+        hi_cells = np.floor(hi / cell).astype(int).tolist()
+
+        for lo_cell, hi_cell in zip(lo_cells, hi_cells):
+            ranges = [range(l, h + 1) for l, h in zip(lo_cell, hi_cell)]
+            for key in itertools.product(*ranges):
+                grid.setdefault(key, set()).add(i)
+
+    pairs = set()
+    for owners in grid.values():
+        if len(owners) > 1:
+            pairs.update(itertools.combinations(sorted(owners), 2))
+
+    for i in wide:
+        pairs.update((min(i, j), max(i, j)) for j in range(len(paths))
+                     if j != i)
+
+    # Report pairs in the original drone order
+    return sorted(pairs)
+
+
+# ------------------------------------------------------------
+# Deconflict a single pair of drones
+# ------------------------------------------------------------
+def check_pair_conflict(path1, path2, safety_distance, between):
+    """
+    Returns one conflict record per encounter between two
+    packed trajectories, labelled with the between pair of
+    drone names.
+    """
+    conflicts = []
+    times1, times2 = path1["t"], path2["t"]
+
+    # Determine overlapping mission window
+    start_time = max(times1[0], times2[0])
+    end_time = min(times1[-1], times2[-1])
+
+    mission_duration = end_time - start_time
+    if mission_duration <= 0:
+        return conflicts
+
+    # Aligned sub-intervals during which both drones stay on
+    # a single segment, keyed by their right end time
+    breaks = np.union1d(times1, times2)
+    breaks = breaks[(breaks >= start_time) & (breaks <= end_time)]
+    seg1 = segment_indices(times1, breaks[1:])
+    seg2 = segment_indices(times2, breaks[1:])
+
+    # Only sub-intervals whose segment boxes meet can conflict
+    mins1, maxs1 = segment_bounding_boxes(path1, safety_distance / 2)
+    mins2, maxs2 = segment_bounding_boxes(path2, safety_distance / 2)
+    live = (np.all(mins1[seg1] <= maxs2[seg2], axis=1) &
+            np.all(mins2[seg2] <= maxs1[seg1], axis=1))
+
+    if not live.any():
+        return conflicts
+
+    # Relative motion over each remaining sub-interval
+    ta = breaks[:-1][live]
+    tb = breaks[1:][live]
+    seg1, seg2 = seg1[live], seg2[live]
+
+    rel_pos, rel_vel = get_relative_motion(path1, seg1, path2, seg2, ta)
+
+    conflict, entry, leave, closest, min_dist_sq = solve_separation(
+        rel_pos, rel_vel, tb - ta, safety_distance
+    )
+
+    # Merge conflicts that carry over into the next sub-interval
+    # into one [first, last, closest] run per encounter
+    sub = np.nonzero(live)[0]
+    runs = []
+    for k in np.nonzero(conflict)[0]:
+        if runs:
+            run = runs[-1]
+            last = run[1]
+            if (sub[k] == sub[last] + 1 and entry[k] == 0 and
+                    leave[last] == tb[last] - ta[last]):
+                run[1] = k
+                if min_dist_sq[k] < min_dist_sq[run[2]]:
+                    run[2] = k
+                continue
+        runs.append([k, k, k])
+
+    # Report each encounter with its closest approach
+    for first, last, best in runs:
+        loc = interpolate(path1, seg1[best], ta[best] + closest[best])
+        conflicts.append(Conflict(
+            time=round(float(ta[first] + entry[first]), 2),
+            exit_time=round(float(ta[last] + leave[last]), 2),
+            location=tuple(round(v, 2) for v in loc),
+            distance=round(math.sqrt(min_dist_sq[best]), 2),
+            between=between
+        ))
+
+    return conflicts
+
+
+# ------------------------------------------------------------
+# Deconflict a batch of drone pairs
+# ------------------------------------------------------------
+def check_pair_batch(batch, drone_names, paths, safety_distance):
+    """
+    Checks a list of (i, j) index pairs into the drone_names
+    and packed paths lists, and returns their conflicts in
+    order.
+    """
+    conflicts = []
+    for i, j in batch:
+        conflicts.extend(check_pair_conflict(
+            paths[i], paths[j], safety_distance,
+            (drone_names[i], drone_names[j])
+        ))
+    return conflicts
+
+
+# Fleet held by each worker process, set once by init_pair_worker
+_worker_fleet = None
+
+
+# ------------------------------------------------------------
+# Hand the fleet to a worker process
+# ------------------------------------------------------------
+def init_pair_worker(drone_names, paths):
+    """
+    Stores the drone names and packed paths in a worker
+    process, so that batches only need to carry index pairs.
+    """
+    global _worker_fleet
+    _worker_fleet = (drone_names, paths)
+
+
+# ------------------------------------------------------------
+# Deconflict a batch of drone pairs in a worker process
+# ------------------------------------------------------------
+def check_worker_batch(batch, safety_distance):
+    """
+    Checks a batch of (i, j) index pairs against the fleet
+    stored by init_pair_worker. Kept at module level so
+    worker processes can run it.
+    """
+    drone_names, paths = _worker_fleet
+    return check_pair_batch(batch, drone_names, paths, safety_distance)
+
+
+# ------------------------------------------------------------
+# Perform pairwise deconfliction across all drones
+# ------------------------------------------------------------
+def check_all_paths_conflict(all_drones_paths, safety_distance, dim, *,
+                             workers=1):
+    """
+    Checks spatial and temporal conflicts between all pairs
+    of drone trajectories in dim spatial dimensions.
+    """
+    # Pack every trajectory once, ignoring drones with
+    # insufficient trajectory data
+    drone_names = []
+    paths = []
+    for d, path in all_drones_paths.items():
+        path = pack_path(path, dim, d)
+        if len(path["t"]) >= 2:
+            drone_names.append(d)
+            paths.append(path)
+
+    # Bounding box of each drone, grown by half the safety
+    # distance so that touching boxes mark trajectories that
+    # may come within the safety buffer
+    boxes = [path_bounding_box(p, safety_distance / 2) for p in paths]
+
+    # Trajectories sharing a grid cell, skipping spatially
+    # disjoint ones that cannot conflict
+    pairs = [
+        (i, j) for i, j in find_candidate_pairs(paths, safety_distance)
+        if boxes_overlap(boxes[i], boxes[j])
+    ]
+
+    # Independent pairs are checked in batches across worker
+    # processes when requested, keeping the serial order. Each
+    # worker receives the packed paths once and batches carry
+    # only index pairs.
+    if workers > 1 and len(pairs) > PAIR_BATCH_SIZE:
+        batches = [
+            pairs[k:k + PAIR_BATCH_SIZE]
+            for k in range(0, len(pairs), PAIR_BATCH_SIZE)
+        ]
+        conflicts = []
+        with ProcessPoolExecutor(
+            max_workers=workers,
+            initializer=init_pair_worker,
+            initargs=(drone_names, paths)
+        ) as executor:
+            for batch_conflicts in executor.map(
+                check_worker_batch, batches,
+                itertools.repeat(safety_distance)
+            ):
+                conflicts.extend(batch_conflicts)
+    else:
+        conflicts = check_pair_batch(
+            pairs, drone_names, paths, safety_distance
+        )
+
+    if conflicts:
+        return {"status": "CONFLICT", "conflicts": conflicts}
+    return {"status": "CLEAR"}
+
+
+# ------------------------------------------------------------
+# Load drone trajectories from a CSV file
+# ------------------------------------------------------------
+def load_paths_from_csv(file_path, dim):
+    """
+    Reads waypoints from a CSV file with a header row naming
+    drone, x, y[, z] and t columns, one waypoint per row.
+    Returns packed trajectories keyed by drone name. Raises
+    ValueError when the file has coordinate columns beyond
+    dim, rather than silently dropping them.
+    """
+    columns = ("x", "y", "z")[:dim] + ("t",)
+
+    waypoints = {}
+    with open(file_path, newline="") as f:
+        reader = csv.DictReader(f)
+
+        extra = [k for k in ("x", "y", "z")[dim:]
+                 if k in (reader.fieldnames or [])]
+        if extra:
+            raise ValueError(
+                f"{file_path} has {', '.join(extra)} coordinates, which "
+                f"{dim}D deconfliction would ignore"
+            )
+
+        for row in reader:
+            waypoints.setdefault(row["drone"], []).append(
+                tuple(float(row[k]) for k in columns)
+            )
+
+    return {
+        name: pack_path(path, dim, name) for name, path in waypoints.items()
+    }
+
+
+# ------------------------------------------------------------
+# Load drone trajectories from a JSON file
+# ------------------------------------------------------------
+def load_paths_from_json(file_path, dim):
+    """
+    Reads a JSON object mapping each drone name to a list of
+    [x, y[, z], t] waypoints. Returns packed trajectories
+    keyed by drone name. Raises ValueError when the file is
+    not such an object or a waypoint does not hold dim + 1
+    values.
+    """
+    with open(file_path) as f:
+        waypoints = json.load(f)
+
+    if not isinstance(waypoints, dict):
+        raise ValueError(
+            f"{file_path} must hold an object mapping drone names to "
+            f"waypoint lists"
+        )
+
+    # Lists can hold waypoints of any width, so reject those
+    # that do not match the dimension before packing
+    for name, path in waypoints.items():
+        if not isinstance(path, list):
+            raise ValueError(
+                f"Waypoints of drone '{name}' in {file_path} must be a list"
+            )
+        for k, waypoint in enumerate(path, 1):
+            if not isinstance(waypoint, list) or len(waypoint) != dim + 1:
+                raise ValueError(
+                    f"Waypoint {k} of drone '{name}' in {file_path} "
+                    f"must be a list of {dim + 1} values"
+                )
+
+    return {
+        name: pack_path(path, dim, name) for name, path in waypoints.items()
+    }
+
+
+# ------------------------------------------------------------
+# Load drone trajectories from a CSV or JSON file
+# ------------------------------------------------------------
+def load_paths_from_file(file_path, dim):
+    """
+    Loads packed trajectories from a JSON file when the name
+    ends in .json, and from a CSV file otherwise.
+    """
+    if file_path.endswith(".json"):
+        return load_paths_from_json(file_path, dim)
+    return load_paths_from_csv(file_path, dim)
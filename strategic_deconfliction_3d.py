@@ -1,7 +1,10 @@
-import math
+import argparse
+import numpy as np
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
 
+import deconfliction_core as core
+
 # ============================================================
 # UAV STRATEGIC DECONFLICTION SYSTEM (3D / 4D)
 # ============================================================
@@ -9,133 +12,51 @@ from mpl_toolkits.mplot3d import Axes3D
 # by checking spatial and temporal conflicts between
 # multiple UAV trajectories in 3D space with time.
 # Each trajectory is defined as (x, y, z, time).
+# The conflict checks live in deconfliction_core; this
+# module fixes the dimension and provides the 3D plotting.
 # ============================================================
 
-
-# ------------------------------------------------------------
-# Compute Euclidean distance between two 3D points
-# ------------------------------------------------------------
-def distance_3d(p1, p2):
-    """
-    Returns the Euclidean distance between two points (x, y, z).
-    """
-    return math.sqrt(
-        (p1[0] - p2[0]) ** 2 +
-        (p1[1] - p2[1]) ** 2 +
-        (p1[2] - p2[2]) ** 2
-    )
-
-
-# ------------------------------------------------------------
-# Sort waypoints in ascending order of time
-# ------------------------------------------------------------
-def sort_path_by_time(path):
-    """
-    Ensures that the waypoint sequence is temporally ordered.
-    """
-    return sorted(path, key=lambda p: p[3])
+# Spatial dimensions of each waypoint
+DIM = 3
 
 
 # ------------------------------------------------------------
-# Linear interpolation between two 3D waypoints
+# Pack (x, y, z, time) waypoints into a trajectory
 # ------------------------------------------------------------
-def interpolate(p_start, p_end, t):
+def pack_path(path, name=None):
     """
-    Computes the interpolated (x, y, z) position at time t
-    between two consecutive waypoints.
+    Converts a sequence of (x, y, z, time) waypoints into a
+    time-ordered trajectory {"pos": (N, 3) array, "t": (N,)
+    array}. Raises ValueError naming the drone when a waypoint
+    is not (x, y, z, time).
     """
-    t1, t2 = p_start[3], p_end[3]
-
-    # Prevent division by zero for identical timestamps
-    if t2 == t1:
-        return (p_start[0], p_start[1], p_start[2])
-
-    ratio = (t - t1) / (t2 - t1)
-
-    x = p_start[0] + ratio * (p_end[0] - p_start[0])
-    y = p_start[1] + ratio * (p_end[1] - p_start[1])
-    z = p_start[2] + ratio * (p_end[2] - p_start[2])
-
-    return (x, y, z)
+    return core.pack_path(path, DIM, name)
 
 
 # ------------------------------------------------------------
-# Determine drone position at a specific time
+# Check conflicts among all drone paths (3D)
 # ------------------------------------------------------------
-def get_position_at_time(path, t):
+def check_all_paths_conflict(all_drones_paths, safety_distance, *,
+                             workers=1):
     """
-    Returns the interpolated drone position at time t
-    along the given trajectory.
+    Checks spatial and temporal conflicts between all pairs
+    of 3D drone trajectories.
     """
-    for i in range(len(path) - 1):
-        if path[i][3] <= t <= path[i + 1][3]:
-            return interpolate(path[i], path[i + 1], t)
-    return None
+    return core.check_all_paths_conflict(
+        all_drones_paths, safety_distance, DIM, workers=workers
+    )
 
 
 # ------------------------------------------------------------
-# Perform pairwise deconfliction across all drones
+# Load (x, y, z, t) drone trajectories from a CSV or JSON file
 # ------------------------------------------------------------
-def check_all_paths_conflict(all_drones_paths, safety_distance, time_step):
+def load_paths_from_file(file_path):
     """
-    Checks spatial and temporal conflicts between all pairs
-    of drone trajectories.
+    Reads drone waypoints from a CSV file with drone, x, y,
+    z and t columns, or a JSON object mapping each drone to
+    [x, y, z, t] waypoints.
     """
-    drone_names = list(all_drones_paths.keys())
-    conflicts = []
-
-    # Pairwise comparison of drone trajectories
-    for i in range(len(drone_names)):
-        for j in range(i + 1, len(drone_names)):
-
-            d1, d2 = drone_names[i], drone_names[j]
-            path1 = sort_path_by_time(all_drones_paths[d1])
-            path2 = sort_path_by_time(all_drones_paths[d2])
-
-            # Ignore drones with insufficient trajectory data
-            if len(path1) < 2 or len(path2) < 2:
-                continue
-
-            # Determine overlapping mission window
-            start_time = max(path1[0][3], path2[0][3])
-            end_time = min(path1[-1][3], path2[-1][3])
-
-            mission_duration = end_time - start_time
-            if mission_duration <= 0:
-                continue
-
-            # Adaptive temporal sampling to avoid missed conflicts
-            effective_step = time_step
-            if effective_step >= mission_duration:
-                effective_step = mission_duration / 20
-
-            if effective_step <= 0:
-                continue
-
-            t = start_time + effective_step
-
-            # Sample positions over overlapping time window
-            while t <= end_time:
-                pos1 = get_position_at_time(path1, t)
-                pos2 = get_position_at_time(path2, t)
-
-                if pos1 and pos2:
-                    dist = distance_3d(pos1, pos2)
-
-                    # Conflict condition based on safety buffer
-                    if dist <= safety_distance:
-                        conflicts.append({
-                            "time": round(t, 2),
-                            "location": tuple(round(v, 2) for v in pos1),
-                            "distance": round(dist, 2),
-                            "between": (d1, d2)
-                        })
-
-                t += effective_step
-
-    if conflicts:
-        return {"status": "CONFLICT", "conflicts": conflicts}
-    return {"status": "CLEAR"}
+    return core.load_paths_from_file(file_path, DIM)
 
 
 # ------------------------------------------------------------
@@ -174,21 +95,18 @@ def plot_paths_3d(all_drones_paths, result):
     ax = fig.add_subplot(111, projection='3d')
 
     for drone_name, path in all_drones_paths.items():
-        if len(path) < 2:
+        path = pack_path(path)
+        if len(path["t"]) < 2:
             continue
 
-        path = sort_path_by_time(path)
-        x = [p[0] for p in path]
-        y = [p[1] for p in path]
-        z = [p[2] for p in path]
+        x, y, z = path["pos"].T
 
         ax.plot(x, y, z, marker='o', label=drone_name)
 
     # Highlight conflict locations
     if result["status"] == "CONFLICT":
-        for c in result["conflicts"]:
-            cx, cy, cz = c["location"]
-            ax.scatter(cx, cy, cz, color='red', s=90)
+        locs = np.array([c.location for c in result["conflicts"]])
+        ax.scatter(locs[:, 0], locs[:, 1], locs[:, 2], color='red', s=90)
 
     ax.set_xlabel("X Position")
     ax.set_ylabel("Y Position")
@@ -203,21 +121,44 @@ def plot_paths_3d(all_drones_paths, result):
 # ------------------------------------------------------------
 if __name__ == "__main__":
 
-    all_drones_paths = {}
+    parser = argparse.ArgumentParser(
+        description="UAV strategic deconfliction (3D)"
+    )
+    parser.add_argument(
+        "paths_file", nargs="?",
+        help="CSV or JSON file of drone waypoints (prompted if omitted)"
+    )
+    parser.add_argument(
+        "--safety-distance", type=float,
+        help="minimum separation in meters (prompted if omitted)"
+    )
+    parser.add_argument(
+        "--workers", type=int, default=1,
+        help="worker processes for checking drone pairs (default: 1)"
+    )
+    args = parser.parse_args()
+
+    # Bulk ingestion from file, interactive entry otherwise
+    if args.paths_file:
+        all_drones_paths = load_paths_from_file(args.paths_file)
+    else:
+        all_drones_paths = {}
 
-    num_drones = int(input("Enter number of drones: "))
+        num_drones = int(input("Enter number of drones: "))
 
-    for i in range(num_drones):
-        name = input(f"\nEnter name for Drone {i + 1}: ")
-        all_drones_paths[name] = get_drone_path(name)
+        for i in range(num_drones):
+            name = input(f"\nEnter name for Drone {i + 1}: ")
+            all_drones_paths[name] = pack_path(get_drone_path(name), name)
 
-    SAFETY_DISTANCE = float(input("\nEnter safety distance (meters): "))
-    TIME_STEP = float(input("Enter time step for checking (seconds): "))
+    if args.safety_distance is None:
+        SAFETY_DISTANCE = float(input("\nEnter safety distance (meters): "))
+    else:
+        SAFETY_DISTANCE = args.safety_distance
 
     result = check_all_paths_conflict(
         all_drones_paths,
         SAFETY_DISTANCE,
-        TIME_STEP
+        workers=args.workers
     )
 
     print("\n--- RESULT ---")
@@ -225,10 +166,10 @@ if __name__ == "__main__":
         print(f"{len(result['conflicts'])} CONFLICT(S) DETECTED\n")
         for idx, c in enumerate(result["conflicts"], 1):
             print(
-                f"{idx}. Time: {c['time']} | "
-                f"Location: {c['location']} | "
-                f"Distance: {c['distance']} m | "
-                f"Between: {c['between']}"
+                f"{idx}. Time: {c.time} - {c.exit_time} | "
+                f"Location: {c.location} | "
+                f"Distance: {c.distance} m | "
+                f"Between: {c.between}"
             )
     else:
         print("NO CONFLICT – ALL PATHS SAFE")
@@ -0,0 +1,117 @@
+import os
+import tempfile
+import unittest
+
+import strategic_deconfliction_2d as deconfliction_2d
+import strategic_deconfliction_3d as deconfliction_3d
+
+# ============================================================
+# REGRESSION CHECKS FOR UAV STRATEGIC DECONFLICTION
+# ============================================================
+# Run with: python -m unittest
+# ============================================================
+
+
+# ------------------------------------------------------------
+# Drones meeting head-on
+# ------------------------------------------------------------
+class HeadOnTest(unittest.TestCase):
+
+    def test_head_on_2d(self):
+        """
+        Two drones reaching the same point at the same time are
+        reported as one conflict at zero distance.
+        """
+        result = deconfliction_2d.check_all_paths_conflict(
+            {"A": [(0, 0, 0), (1, 0, 10)], "B": [(3, 0, 0), (0, 0, 10)]},
+            1.0
+        )
+
+        self.assertEqual(result["status"], "CONFLICT")
+        self.assertEqual(len(result["conflicts"]), 1)
+        self.assertEqual(result["conflicts"][0].distance, 0.0)
+        self.assertEqual(result["conflicts"][0].between, ("A", "B"))
+
+    def test_head_on_3d(self):
+        """
+        Head-on drones on the same straight leg conflict around
+        the meeting point and time.
+        """
+        result = deconfliction_3d.check_all_paths_conflict(
+            {
+                "A": [(0, 0, 10, 0), (100, 0, 10, 10)],
+                "B": [(100, 0, 10, 0), (0, 0, 10, 10)],
+            },
+            5.0
+        )
+
+        conflict = result["conflicts"][0]
+        self.assertEqual(result["status"], "CONFLICT")
+        self.assertEqual(conflict.distance, 0.0)
+        self.assertEqual((conflict.time, conflict.exit_time), (4.75, 5.25))
+        self.assertEqual(conflict.location, (50.0, 0.0, 10.0))
+
+    def test_separated_by_altitude(self):
+        """
+        Drones crossing at different altitudes do not conflict.
+        """
+        result = deconfliction_3d.check_all_paths_conflict(
+            {
+                "A": [(0, 0, 10, 0), (100, 0, 10, 10)],
+                "B": [(100, 0, 30, 0), (0, 0, 30, 10)],
+            },
+            5.0
+        )
+
+        self.assertEqual(result["status"], "CLEAR")
+
+
+
+# ------------------------------------------------------------
+# Loading fleets of the wrong dimension
+# ------------------------------------------------------------
+class LoadDimensionTest(unittest.TestCase):
+
+    def write_file(self, suffix, text):
+        """
+        Writes text to a temporary file removed after the test.
+        """
+        fd, file_path = tempfile.mkstemp(suffix=suffix)
+        with os.fdopen(fd, "w") as f:
+            f.write(text)
+        self.addCleanup(os.remove, file_path)
+        return file_path
+
+    def test_3d_csv_rejected_in_2d(self):
+        """
+        A CSV with altitudes is not flattened by the 2D loader.
+        """
+        file_path = self.write_file(
+            ".csv", "drone,x,y,z,t\nA,0,0,10,0\nA,1,0,10,1\n"
+        )
+
+        with self.assertRaises(ValueError):
+            deconfliction_2d.load_paths_from_file(file_path)
+
+    def test_3d_json_rejected_in_2d(self):
+        """
+        JSON waypoints with an altitude are rejected by the 2D
+        loader.
+        """
+        file_path = self.write_file(".json", '{"A": [[0, 0, 10, 0]]}')
+
+        with self.assertRaises(ValueError):
+            deconfliction_2d.load_paths_from_file(file_path)
+
+    def test_json_root_must_be_object(self):
+        """
+        A JSON file that is not an object of drones is rejected.
+        """
+        file_path = self.write_file(".json", "[[0, 0, 0]]")
+
+        with self.assertRaises(ValueError):
+            deconfliction_2d.load_paths_from_file(file_path)
+
+
+if __name__ == "__main__":
+    unittest.main()